@@ -1 +1 @@
-from .find_a_factor import find_a_factor, FactoringMethod
\ No newline at end of file
+from .find_a_factor import find_a_factor, find_a_factor_many, FactoringMethod, Factorizer
\ No newline at end of file
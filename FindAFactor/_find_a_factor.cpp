@@ -15,6 +15,9 @@
 #include "dispatchqueue.hpp"
 #include "wheel_factorization.hpp"
 
+#include <array>
+#include <atomic>
+#include <bitset>
 #include <future>
 #include <iostream>
 #include <memory>
@@ -28,6 +31,8 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+namespace py = pybind11;
+
 namespace Qimcifa {
 
 typedef boost::multiprecision::cpp_int BigInteger;
@@ -36,13 +41,13 @@ const unsigned CpuCount = std::thread::hardware_concurrency();
 DispatchQueue dispatch(CpuCount);
 
 size_t biggestWheel = 1U;
-std::vector<size_t> wheel;
+const std::vector<size_t> *wheel = nullptr;
 
 BigInteger smoothForwardFn(const BigInteger &p) {
-  return wheel[(size_t)(p % wheel.size())] + (p / wheel.size()) * biggestWheel;
+  return (*wheel)[(size_t)(p % wheel->size())] + (p / wheel->size()) * biggestWheel;
 }
 BigInteger smoothBackwardFn(const BigInteger &p) {
-  return std::distance(wheel.begin(), std::lower_bound(wheel.begin(), wheel.end(), (size_t)(p % biggestWheel))) + wheel.size() * (p / biggestWheel) + 1U;
+  return std::distance(wheel->begin(), std::lower_bound(wheel->begin(), wheel->end(), (size_t)(p % biggestWheel))) + wheel->size() * (p / biggestWheel) + 1U;
 }
 
 
@@ -255,6 +260,79 @@ std::vector<size_t> SieveOfEratosthenes(const size_t &n) {
   return knownPrimes;
 }
 
+// Bools per sieving block, sized so a block stays resident in L1/L2 while
+// every base prime strides across it. (One block covers about 15/4 times
+// this many integers, because the buffer skips multiples of 2, 3, and 5.)
+constexpr size_t SIEVE_BLOCK_CARDINALITY = 1U << 15U;
+
+std::vector<size_t> SegmentedSieveOfEratosthenes(const size_t &n) {
+  if (backward5(n) <= (SIEVE_BLOCK_CARDINALITY << 1U)) {
+    // The monolithic buffer is already cache-resident.
+    return SieveOfEratosthenes(n);
+  }
+
+  // Base primes up to the square root come from the monolithic sieve.
+  // (That buffer is tiny next to the full range.)
+  const size_t sqrtN = _sqrt(n);
+  std::vector<size_t> knownPrimes = SieveOfEratosthenes(sqrtN);
+  knownPrimes.reserve((size_t)(((double)n) / log((double)n)));
+  const size_t baseCount = knownPrimes.size();
+
+  // Re-create the candidate enumeration of the monolithic sieve,
+  // advanced past the base primes.
+  unsigned short wheel5 = 129U;
+  unsigned long long wheel7 = 9009416540524545ULL;
+  size_t o = 1U;
+  o += GetWheel5and7Increment(wheel5, wheel7);
+  while (forward3(o) <= sqrtN) {
+    o += GetWheel5and7Increment(wheel5, wheel7);
+  }
+
+  std::unique_ptr<bool[]> uNotPrime(new bool[SIEVE_BLOCK_CARDINALITY]());
+  bool *notPrime = uNotPrime.get();
+
+  for (size_t low = sqrtN + 1U; low <= n;) {
+    // 1-based positions (in the 2-3-5-coprime sequence) covered by this block
+    const size_t cardLow = backward5(low);
+    const size_t high = std::min(forward5(cardLow + SIEVE_BLOCK_CARDINALITY - 2U), n);
+
+    // Cross off the block while it is still hot in cache.
+    for (size_t pi = 3U; pi < baseCount; ++pi) {
+      const size_t p = knownPrimes[pi];
+      const size_t p2 = p << 1U;
+      const size_t p4 = p << 2U;
+
+      // Find the first multiple of p in the block whose cofactor is coprime to 6.
+      size_t k = (low + p - 1U) / p;
+      while (!(k % 2U) || !(k % 3U)) {
+        ++k;
+      }
+
+      // Alternate strides of 4p and 2p to keep the cofactor coprime to 6,
+      // exactly as in the monolithic cross-off loop.
+      bool isFourStride = ((k % 6U) == 1U);
+      for (size_t i = k * p; i <= high; i += (isFourStride ? p4 : p2), isFourStride = !isFourStride) {
+        if (i % 5U) {
+          notPrime[backward5(i) - cardLow] = true;
+        }
+      }
+    }
+
+    // Collect the primes that survived this block.
+    for (size_t p = forward3(o); p <= high; p = forward3(o)) {
+      o += GetWheel5and7Increment(wheel5, wheel7);
+      if (!notPrime[backward5(p) - cardLow]) {
+        knownPrimes.push_back(p);
+      }
+    }
+
+    std::fill(notPrime, notPrime + SIEVE_BLOCK_CARDINALITY, false);
+    low = high + 1U;
+  }
+
+  return knownPrimes;
+}
+
 bool isMultiple(const BigInteger &p, const std::vector<size_t> &knownPrimes) {
   for (const size_t &prime : knownPrimes) {
     if (!(p % prime)) {
@@ -265,6 +343,135 @@ bool isMultiple(const BigInteger &p, const std::vector<size_t> &knownPrimes) {
   return false;
 }
 
+#if defined(__GNUC__) && defined(__x86_64__) && defined(__linux__)
+// Function multiversioning: the compiler emits AVX-512/AVX2 clones of this
+// trivially-vectorizable loop and picks the widest one at load time.
+__attribute__((target_clones("arch=x86-64-v4", "avx2", "default")))
+#endif
+void and_buffers(unsigned char *dst, const unsigned char *src, const size_t &len) {
+  for (size_t i = 0U; i < len; ++i) {
+    dst[i] &= src[i];
+  }
+}
+
+#if defined(__GNUC__) && defined(__x86_64__) && defined(__linux__)
+__attribute__((target_clones("arch=x86-64-v4", "avx2", "default")))
+#endif
+void xor_words(uint64_t *dst, const uint64_t *src, const size_t &len) {
+  for (size_t i = 0U; i < len; ++i) {
+    dst[i] ^= src[i];
+  }
+}
+
+#if defined(__GNUC__) && defined(__x86_64__) && defined(__linux__)
+// The clones vectorize the per-word popcount (VPOPCNTDQ or the pshufb
+// nibble-table trick, whichever the CPU offers) instead of a serial
+// bit-count dependency chain.
+__attribute__((target_clones("arch=x86-64-v4", "avx2", "default")))
+#endif
+uint64_t popcount_words(const uint64_t *words, const size_t &len) {
+  uint64_t count = 0U;
+  for (size_t i = 0U; i < len; ++i) {
+    count += (uint64_t)std::bitset<64U>(words[i]).count();
+  }
+  return count;
+}
+
+// A GF(2) matrix row, packed 64 factor-base primes to the word. The XOR
+// kernel (the whole inner loop of Gaussian elimination) goes through the
+// multiversioned xor_words(), so row reduction gets AVX-512/AVX2 loads and
+// stores where the CPU has them.
+struct BitRow {
+  std::vector<uint64_t> words;
+
+  BitRow() {
+    // Intentionally left blank. (An empty row marks a rejected candidate.)
+  }
+  BitRow(const size_t &bitCount) : words((bitCount + 63U) >> 6U, 0U) {}
+
+  bool empty() const { return words.empty(); }
+  bool none() const {
+    for (const uint64_t &w : words) {
+      if (w) {
+        return false;
+      }
+    }
+    return true;
+  }
+  bool test(const size_t &bit) const { return (words[bit >> 6U] >> (bit & 63U)) & 1U; }
+  uint64_t weight() const { return popcount_words(words.data(), words.size()); }
+  void flip(const size_t &bit) { words[bit >> 6U] ^= 1ULL << (bit & 63U); }
+  BitRow &operator^=(const BitRow &other) {
+    xor_words(words.data(), other.words.data(), words.size());
+    return *this;
+  }
+  bool operator==(const BitRow &other) const { return words == other.words; }
+};
+
+// Enumerate the wheel (integers in [1, radius] coprime to the given primes) by
+// AND-composing one byte-map of residues per prime, a cache-resident block at
+// a time, instead of taking a big-integer modulus per candidate per prime.
+std::vector<size_t> composeWheel(const size_t &radius, const std::vector<size_t> &primes) {
+  constexpr size_t WHEEL_BLOCK_BYTES = 1U << 18U;
+  std::vector<size_t> output;
+  std::vector<unsigned char> composite(WHEEL_BLOCK_BYTES);
+  std::vector<unsigned char> residues(WHEEL_BLOCK_BYTES);
+  for (size_t low = 1U; low <= radius; low += WHEEL_BLOCK_BYTES) {
+    const size_t len = std::min(WHEEL_BLOCK_BYTES, radius - low + 1U);
+    std::fill(composite.begin(), composite.begin() + len, 1U);
+    for (const size_t &p : primes) {
+      std::fill(residues.begin(), residues.begin() + len, 1U);
+      for (size_t i = ((low + p - 1U) / p) * p; i < (low + len); i += p) {
+        residues[i - low] = 0U;
+      }
+      and_buffers(composite.data(), residues.data(), len);
+    }
+    for (size_t i = 0U; i < len; ++i) {
+      if (composite[i]) {
+        output.push_back(low + i);
+      }
+    }
+  }
+
+  return output;
+}
+
+// Repeated calls in one process (a persistent session, or a batch) usually
+// reuse the same bounds and levels, so the two expensive pieces of per-call
+// setup — the base-prime sieve and the composed wheel — keep their last
+// result and hand it back when the parameters repeat. Both return references
+// to the cached storage rather than copies: at default levels the wheel alone
+// is hundreds of megabytes, and factoring runs are serialized (see
+// factoringMutex below), so no run can rebuild a cache another run is reading.
+const std::vector<size_t> &cachedSieveOfEratosthenes(const size_t &primeCeiling) {
+  static std::mutex cacheMutex;
+  static size_t ceilingKey = SIZE_MAX;
+  static std::vector<size_t> cached;
+  std::lock_guard<std::mutex> lock(cacheMutex);
+  if (primeCeiling != ceilingKey) {
+    cached = SegmentedSieveOfEratosthenes(primeCeiling);
+    ceilingKey = primeCeiling;
+  }
+  return cached;
+}
+
+const std::vector<size_t> &cachedComposeWheel(const size_t &radius, const std::vector<size_t> &primes) {
+  static std::mutex cacheMutex;
+  static size_t radiusKey = SIZE_MAX;
+  static std::vector<size_t> primesKey;
+  static std::vector<size_t> cached;
+  std::lock_guard<std::mutex> lock(cacheMutex);
+  if ((radius != radiusKey) || (primes != primesKey)) {
+    cached = composeWheel(radius, primes);
+    if (cached.empty()) {
+      cached.push_back(1U);
+    }
+    radiusKey = radius;
+    primesKey = primes;
+  }
+  return cached;
+}
+
 boost::dynamic_bitset<size_t> nestGearGeneration(std::vector<size_t> primes) {
   BigInteger radius = 1U;
   for (const size_t &i : primes) {
@@ -379,7 +586,7 @@ struct Factorizer {
   bool isIncomplete;
   std::vector<size_t> smoothPrimes;
   std::vector<BigInteger> smoothNumberKeys;
-  std::vector<boost::dynamic_bitset<size_t>> smoothNumberValues;
+  std::vector<BitRow> smoothNumberValues;
   ForwardFn forwardFn;
   ForwardFn backwardFn;
 
@@ -453,7 +660,7 @@ struct Factorizer {
         // The candidate is guaranteed to be between toFactor and its square,
         // so subtracting toFactor is equivalent to % toFactor.
         const BigInteger ySqr = (x * x) - toFactor;
-        const boost::dynamic_bitset<size_t> rfv = factorizationParityVector(ySqr);
+        const BitRow rfv = factorizationParityVector(ySqr);
         if (rfv.empty()) {
           // The number is useless to us.
           // batchItem += GetGearIncrement(inc_seqs);
@@ -538,99 +745,88 @@ struct Factorizer {
     return 1U;
   }
 
-  std::vector<std::vector<size_t>> extractSolutionRows(const boost::dynamic_bitset<size_t>& marks) {
-    std::vector<std::vector<size_t>> solutions;
-
-    for (size_t col = 0U; col < marks.size(); ++col) {
-      if (marks.test(col)) {
-        // Skip pivot columns
-        continue;
-      }
-
-      std::vector<size_t> selectedRows;
-      boost::dynamic_bitset<size_t> solutionRow(marks.size(), 0U);
-
-      // Collect rows that have a 1 in this free column
-      for (size_t row = 0U; row < smoothNumberValues.size(); ++row) {
-        if (smoothNumberValues[row].test(col)) {
-          selectedRows.push_back(row);
-           // XOR to construct dependency
-          solutionRow ^= smoothNumberValues[row];
-        }
-      }
-
-      // Ensure the dependency is valid (all exponents must sum to even parity)
-      if (solutionRow.none()) {
-        solutions.push_back(selectedRows);
-      }
-    }
-
-    return solutions;
-  }
-
-  // Perform Gaussian elimination on a binary matrix
+  // Perform Gaussian elimination on a binary matrix, with "waiting list"
+  // scheduling (in the style of GBLA): the unit of parallel work is a row,
+  // not a pivot column. Each worker reduces its row against every pivot
+  // discovered so far, in ascending column order; when the row has a set bit
+  // in a column with no pivot yet, the row is promoted to be that column's
+  // pivot (and becomes immutable). A row that runs out of set bits is a
+  // linear dependency. This removes the per-pivot full-matrix sweep and its
+  // two thread barriers per column.
   std::vector<std::vector<size_t>> gaussianElimination() {
     const size_t rows = smoothNumberValues.size();
-    boost::dynamic_bitset<size_t> marks(smoothPrimes.size(), 0U);
-    for (size_t col = 0U; col < smoothPrimes.size(); ++col) {
-      // Look for a pivot row in this column
-      size_t row = col;
-      for (; row < rows; ++row) {
-        if (smoothNumberValues[row][col]) {
-          // Make sure the rows are in reduced row echelon order.
-          if (row != col) {
-            std::swap(smoothNumberKeys[row], smoothNumberKeys[col]);
-            std::swap(smoothNumberValues[row], smoothNumberValues[col]);
-          }
+    const size_t cols = smoothPrimes.size();
 
-          // Mark this column as having a pivot.
-          marks.set(col);
-          break;
-        }
-      }
+    // pivotRowOfCol[c] is the row that owns column c (or SIZE_MAX, if no
+    // pivot has been discovered for that column yet).
+    std::unique_ptr<std::atomic<size_t>[]> pivotRowOfCol(new std::atomic<size_t>[cols]);
+    for (size_t c = 0U; c < cols; ++c) {
+      pivotRowOfCol[c] = SIZE_MAX;
+    }
+    std::atomic<size_t> nextRow(0U);
+    std::mutex pivotMutex;
+
+    // Markowitz-style heuristic: hand out the sparsest rows first, so the
+    // pivots claimed early are low-weight and every later reduction against
+    // them causes less fill-in. Row weight is one popcount pass per row.
+    std::vector<size_t> order(rows);
+    std::vector<uint64_t> weight(rows);
+    for (size_t r = 0U; r < rows; ++r) {
+      order[r] = r;
+      weight[r] = smoothNumberValues[r].weight();
+    }
+    std::stable_sort(order.begin(), order.end(), [&weight](const size_t &a, const size_t &b) { return weight[a] < weight[b]; });
 
-      if ((col < smoothPrimes.size()) && marks[col]) {
-        // Row might have been swapped.
-        const boost::dynamic_bitset<size_t> &cm = smoothNumberValues[col];
-        // Pivot found, now eliminate entries in this column
-        const size_t maxLcv = std::min((size_t)CpuCount, rows);
-        for (size_t cpu = 0U; cpu < maxLcv; ++cpu) {
-          dispatch.dispatch([this, cpu, &col, &rows, &cm]() -> bool {
-            // Notice that each thread updates rows with space increments of cpuCount,
-            // based on the same unchanged outer-loop row, and this covers the inner-loop set.
-            // We're covering every row except for the one corresponding to "col."
-            // We break this into two loops to avoid an inner conditional to check whether row == col.
-            const size_t midRow = std::min(col, rows);
-            size_t irow = cpu;
-            for (; irow < midRow; irow += CpuCount) {
-              boost::dynamic_bitset<size_t> &rm = this->smoothNumberValues[irow];
-              if (rm.test(col)) {
-                // XOR-ing factorization rows
-                // is like multiplying the numbers.
-                rm ^= cm;
-              }
-            }
-            if (irow == col) {
-              irow += CpuCount;
+    std::vector<std::vector<size_t>> solutions;
+    std::mutex solutionsMutex;
+
+    const size_t maxLcv = std::min((size_t)CpuCount, rows);
+    for (size_t cpu = 0U; cpu < maxLcv; ++cpu) {
+      dispatch.dispatch([this, cols, rows, &pivotRowOfCol, &nextRow, &pivotMutex, &order, &solutions, &solutionsMutex]() -> bool {
+        for (size_t i = nextRow++; i < rows; i = nextRow++) {
+          const size_t r = order[i];
+          BitRow &row = this->smoothNumberValues[r];
+          bool isPivot = false;
+          for (size_t c = 0U; c < cols; ++c) {
+            if (!row.test(c)) {
+              continue;
             }
-            for (; irow < rows; irow += CpuCount) {
-              boost::dynamic_bitset<size_t> &rm = this->smoothNumberValues[irow];
-              if (rm.test(col)) {
-                // XOR-ing factorization rows
-                // is like multiplying the numbers.
-                rm ^= cm;
+
+            size_t p = pivotRowOfCol[c].load(std::memory_order_acquire);
+            if (p == SIZE_MAX) {
+              std::lock_guard<std::mutex> lock(pivotMutex);
+              p = pivotRowOfCol[c].load(std::memory_order_relaxed);
+              if (p == SIZE_MAX) {
+                // All lower columns of this row are already clear,
+                // so promote it to be the pivot for this column.
+                // (It is never written again.)
+                pivotRowOfCol[c].store(r, std::memory_order_release);
+                isPivot = true;
+                break;
               }
             }
 
-            return false;
-          });
+            // Reduce by the (now immutable) pivot row. XOR-ing factorization
+            // rows is like multiplying the numbers, so keep the key in step.
+            row ^= this->smoothNumberValues[p];
+            this->smoothNumberKeys[r] = (this->smoothNumberKeys[r] * this->smoothNumberKeys[p]) % this->toFactor;
+          }
+
+          // A row that finishes its scan without claiming a column had every
+          // set bit reduced away: it is a linear dependency, and its key
+          // already accumulated the whole product. Collect it right here, so
+          // no second pass over the matrix is needed.
+          if (!isPivot) {
+            std::lock_guard<std::mutex> lock(solutionsMutex);
+            solutions.push_back(std::vector<size_t>{ r });
+          }
         }
-        // All dispatched work must complete.
-        dispatch.finish();
-      }
-    }
 
-    const std::vector<std::vector<size_t>> solutions = extractSolutionRows(marks);
+        return false;
+      });
+    }
+    // All dispatched work must complete.
+    dispatch.finish();
 
     if (solutions.empty()) {
       throw std::runtime_error("Gaussian elimination found no solution (with rank " + std::to_string(smoothPrimes.size()) + "). If your rank is very low, consider increasing the smoothness bound. Otherwise, produce and retain more smooth numbers.");
@@ -698,8 +894,8 @@ struct Factorizer {
   }
 
   // Compute the prime factorization modulo 2
-  boost::dynamic_bitset<size_t> factorizationParityVector(BigInteger num) {
-    boost::dynamic_bitset<size_t> vec(smoothPrimes.size(), 0U);
+  BitRow factorizationParityVector(BigInteger num) {
+    BitRow vec(smoothPrimes.size());
     std::vector<size_t> spids(smoothPrimes.size());
     std::iota(spids.begin(), spids.end(), 0);
     while (true) {
@@ -737,7 +933,7 @@ struct Factorizer {
     if (num != 1U) {
       // The number was not fully factored, because it is not smooth.
       // We reject it as a sieving candidate.
-      return boost::dynamic_bitset<size_t>();
+      return BitRow();
     }
 
     // This number is smooth, and we return its factorization parity.
@@ -745,6 +941,342 @@ struct Factorizer {
   }
 };
 
+// SplitMix64: used only to spread a small seed across xoshiro256** state.
+inline uint64_t splitmix64(uint64_t &x) {
+  uint64_t z = (x += 0x9E3779B97F4A7C15ULL);
+  z = (z ^ (z >> 30U)) * 0xBF58476D1CE4E5B9ULL;
+  z = (z ^ (z >> 27U)) * 0x94D049BB133111EBULL;
+  return z ^ (z >> 31U);
+}
+
+inline uint64_t rotl64(const uint64_t &x, const int &k) { return (x << k) | (x >> (64 - k)); }
+
+// xoshiro256**: five shifts, three XORs, one rotate per draw — branchless,
+// lock-free, and one independent stream per worker, so random parameter
+// selection never serializes the thread pool the way a shared libc rand()
+// would.
+struct Xoshiro256StarStar {
+  uint64_t s[4];
+
+  Xoshiro256StarStar(uint64_t seed) {
+    for (size_t i = 0U; i < 4U; ++i) {
+      s[i] = splitmix64(seed);
+    }
+  }
+
+  uint64_t next() {
+    const uint64_t result = rotl64(s[1] * 5U, 7) * 9U;
+    const uint64_t t = s[1] << 17U;
+    s[2] ^= s[0];
+    s[3] ^= s[1];
+    s[1] ^= s[2];
+    s[0] ^= s[3];
+    s[2] ^= t;
+    s[3] = rotl64(s[3], 45);
+
+    return result;
+  }
+};
+
+// Montgomery multiplication for (odd) moduli that fit one 64-bit limb.
+// With n fixed per call, (a * b) mod n becomes two 128x64 multiplies and an
+// add — no hardware divide anywhere in the hot loop.
+struct MontgomeryContext64 {
+  uint64_t n;    // modulus (odd)
+  uint64_t nInv; // -n^-1 mod 2^64
+  uint64_t r2;   // 2^128 mod n
+
+  MontgomeryContext64(const uint64_t &modulus) : n(modulus) {
+    // Newton's iteration doubles the correct low bits each round;
+    // for odd n, inv = n is already correct mod 2^3.
+    uint64_t inv = n;
+    for (int i = 0; i < 5; ++i) {
+      inv *= 2U - n * inv;
+    }
+    nInv = ~inv + 1U;
+    const uint64_t r1 = (~(uint64_t)0U) % n + 1U; // 2^64 mod n
+    r2 = (uint64_t)(((__uint128_t)r1 * r1) % n);
+  }
+
+  uint64_t reduce(const __uint128_t &t) const {
+    const uint64_t m = (uint64_t)t * nInv;
+    const uint64_t r = (uint64_t)((t + (__uint128_t)m * n) >> 64U);
+    return (r >= n) ? (r - n) : r;
+  }
+  uint64_t mul(const uint64_t &a, const uint64_t &b) const { return reduce((__uint128_t)a * b); }
+  uint64_t add(const uint64_t &a, const uint64_t &b) const {
+    const uint64_t s = a + b;
+    return ((s < a) || (s >= n)) ? (s - n) : s;
+  }
+  uint64_t toMont(const uint64_t &a) const { return mul(a, r2); }
+};
+
+uint64_t gcd64(uint64_t a, uint64_t b) {
+  while (b) {
+    a %= b;
+    std::swap(a, b);
+  }
+  return a;
+}
+
+// Brent's variant of Pollard's Rho (see the big-integer version below),
+// specialized to one limb with Montgomery arithmetic. The gcd arguments stay
+// in the Montgomery domain: R is a unit mod n, so it never changes a gcd.
+//
+// Four independent Brent walks advanced in lockstep in one loop. A single
+// walk is one long serial dependency chain, so the multiplier sits mostly
+// idle waiting on its own latency; interleaving four chains keeps it fed
+// (the lane-parallel idea, done with instruction-level rather than SIMD
+// parallelism, since 64x64->128 multiplies have no vector form here).
+uint64_t pollardRhoBrent64x4(const uint64_t &n, const uint64_t *cs, const std::atomic<bool> &found)
+{
+    if (n == 1U) return 1U;
+
+    const MontgomeryContext64 mont(n);
+
+    uint64_t cM[4U], y[4U], q[4U], x[4U], ys[4U];
+    bool dead[4U];
+    for (int l = 0; l < 4; ++l) {
+        const uint64_t c = cs[l] % n;
+        // Degenerate polynomial constants never find anything — park the lane.
+        dead[l] = (c == 0U) || (c == n - 2U);
+        cM[l] = mont.toMont(c);
+        y[l] = mont.toMont(2U);
+        q[l] = mont.toMont(1U);
+        x[l] = ys[l] = 0U;
+    }
+
+    uint64_t r = 1U;                 // Brent's power-of-2 cycle length
+    const uint64_t batchSize = 128U; // batch GCD every this many steps
+
+    for (;;) {
+        for (int l = 0; l < 4; ++l) {
+            x[l] = y[l];
+        }
+        // Advance all tortoises to the start of the next Brent segment
+        for (uint64_t i = 0U; i < r; ++i) {
+            for (int l = 0; l < 4; ++l) {
+                y[l] = mont.add(mont.mul(y[l], y[l]), cM[l]);
+            }
+        }
+
+        uint64_t k = 0U;
+        while (k < r) {
+            for (int l = 0; l < 4; ++l) {
+                ys[l] = y[l];
+            }
+            const uint64_t steps = std::min(batchSize, r - k);
+            for (uint64_t i = 0U; i < steps; ++i) {
+                for (int l = 0; l < 4; ++l) {
+                    y[l] = mont.add(mont.mul(y[l], y[l]), cM[l]);
+                    const uint64_t diff = (y[l] > x[l]) ? (y[l] - x[l]) : (x[l] - y[l]);
+                    q[l] = mont.mul(q[l], diff);
+                }
+            }
+            k += steps;
+
+            // Another thread already split n — stop burning cycles here.
+            if (found.load(std::memory_order_relaxed)) {
+                return 1U;
+            }
+
+            size_t deadCount = 0U;
+            for (int l = 0; l < 4; ++l) {
+                if (dead[l]) {
+                    ++deadCount;
+                    continue;
+                }
+                uint64_t factor = gcd64(n, q[l]);
+                if (factor == n) {
+                    // Overshot: fall back to step-by-step from the lane's
+                    // last checkpoint (same recovery as the big-integer kernel).
+                    factor = 1U;
+                    uint64_t yy = ys[l];
+                    while (factor == 1U) {
+                        yy = mont.add(mont.mul(yy, yy), cM[l]);
+                        const uint64_t diff = (yy > x[l]) ? (yy - x[l]) : (x[l] - yy);
+                        factor = gcd64(n, diff);
+                    }
+                    if (factor == n) {
+                        // This lane's walk has cycled without splitting n;
+                        // park it and let the other lanes keep going.
+                        dead[l] = true;
+                        ++deadCount;
+                        continue;
+                    }
+                }
+                if (factor != 1U) {
+                    return factor;
+                }
+            }
+            if (deadCount == 4U) {
+                return 1U;
+            }
+        }
+
+        r <<= 1U;
+    }
+}
+
+#if defined(__GNUC__) && defined(__x86_64__)
+#define FAF_FORCE_INLINE inline __attribute__((always_inline))
+#else
+#define FAF_FORCE_INLINE inline
+#endif
+
+typedef unsigned __int128 uint128_t;
+
+// Montgomery multiplication for (odd) moduli of two 64-bit limbs, using the
+// CIOS (coarsely integrated operand scanning) form. The multiply is two
+// independent carry chains, which is exactly what ADCX/ADOX interleave; the
+// hot members are force-inlined so they compile with the ISA of whichever
+// dispatch clone calls them.
+struct MontgomeryContext128 {
+  uint128_t n;
+  uint64_t nInv; // -n^-1 mod 2^64
+
+  MontgomeryContext128(const uint128_t &modulus) : n(modulus) {
+    uint64_t inv = (uint64_t)n;
+    for (int i = 0; i < 5; ++i) {
+      inv *= 2U - (uint64_t)n * inv;
+    }
+    nInv = ~inv + 1U;
+  }
+
+  FAF_FORCE_INLINE uint128_t mul(const uint128_t &a, const uint128_t &b) const {
+    const uint64_t a0 = (uint64_t)a, a1 = (uint64_t)(a >> 64U);
+    const uint64_t b0 = (uint64_t)b, b1 = (uint64_t)(b >> 64U);
+    const uint64_t n0 = (uint64_t)n, n1 = (uint64_t)(n >> 64U);
+    const uint64_t as[2] = { a0, a1 };
+    uint64_t t[4] = { 0U, 0U, 0U, 0U };
+    for (int i = 0; i < 2; ++i) {
+      uint128_t s = (uint128_t)t[0] + (uint128_t)as[i] * b0;
+      t[0] = (uint64_t)s;
+      uint128_t c = s >> 64U;
+      s = (uint128_t)t[1] + (uint128_t)as[i] * b1 + c;
+      t[1] = (uint64_t)s;
+      c = s >> 64U;
+      s = (uint128_t)t[2] + c;
+      t[2] = (uint64_t)s;
+      t[3] += (uint64_t)(s >> 64U);
+
+      const uint64_t m = t[0] * nInv;
+      s = (uint128_t)t[0] + (uint128_t)m * n0;
+      c = s >> 64U;
+      s = (uint128_t)t[1] + (uint128_t)m * n1 + c;
+      t[0] = (uint64_t)s;
+      c = s >> 64U;
+      s = (uint128_t)t[2] + c;
+      t[1] = (uint64_t)s;
+      t[2] = t[3] + (uint64_t)(s >> 64U);
+      t[3] = 0U;
+    }
+    uint128_t r = ((uint128_t)t[1] << 64U) | t[0];
+    if (t[2] || (r >= n)) {
+      r -= n;
+    }
+    return r;
+  }
+  FAF_FORCE_INLINE uint128_t add(const uint128_t &a, const uint128_t &b) const {
+    const uint128_t s = a + b;
+    return ((s < a) || (s >= n)) ? (s - n) : s;
+  }
+  uint128_t toMont(const uint128_t &a) const {
+    // 2^128 mod n, squared into the domain by repeated modular doubling:
+    // setup-only, so simplicity beats speed here.
+    uint128_t r = ((uint128_t)0U - n) % n;
+    for (int i = 0; i < 128; ++i) {
+      const uint128_t d = r << 1U;
+      r = ((d < r) || (d >= n)) ? (d - n) : d;
+    }
+    return mul(r, a % n);
+  }
+};
+
+uint128_t toUint128(const BigInteger &v) { return ((uint128_t)(uint64_t)(v >> 64U) << 64U) | (uint64_t)(v & (BigInteger)UINT64_MAX); }
+
+uint128_t gcd128(uint128_t a, uint128_t b) {
+  while (b) {
+    a %= b;
+    std::swap(a, b);
+  }
+  return a;
+}
+
+// Brent's Rho loop over MontgomeryContext128, shared by the dispatch
+// wrappers below.
+FAF_FORCE_INLINE uint128_t pollardRhoBrent128Body(const uint128_t &n, const uint128_t &c)
+{
+    if (n == 1U) return 1U;
+
+    // Degenerate polynomial constants — skip.
+    if (c == 0U || c == n - 2U) return 1U;
+
+    const MontgomeryContext128 mont(n);
+    const uint128_t cM = mont.toMont(c);
+
+    uint128_t y = mont.toMont(2U); // tortoise checkpoint
+    uint64_t r = 1U;               // Brent's power-of-2 cycle length
+    uint128_t q = mont.toMont(1U); // accumulated product for batched GCD
+    uint128_t x = 0U, ys = 0U, factor;
+
+    const uint64_t batchSize = 128U; // batch GCD every this many steps
+
+    do {
+        x = y;
+        for (uint64_t i = 0U; i < r; ++i) {
+            y = mont.add(mont.mul(y, y), cM);
+        }
+
+        uint64_t k = 0U;
+        factor = 1U;
+
+        while (k < r && factor == 1U) {
+            ys = y;
+            const uint64_t steps = std::min(batchSize, r - k);
+            for (uint64_t i = 0U; i < steps; ++i) {
+                y = mont.add(mont.mul(y, y), cM);
+                const uint128_t diff = (y > x) ? (y - x) : (x - y);
+                q = mont.mul(q, diff);
+            }
+            factor = gcd128(n, q);
+            k += steps;
+        }
+
+        r <<= 1U;
+
+    } while (factor == 1U);
+
+    if (factor == n) {
+        factor = 1U;
+        y = ys;
+        while (factor == 1U) {
+            y = mont.add(mont.mul(y, y), cM);
+            const uint128_t diff = (y > x) ? (y - x) : (x - y);
+            factor = gcd128(n, diff);
+        }
+    }
+
+    return (factor == n) ? 1U : factor;
+}
+
+#if defined(__GNUC__) && defined(__x86_64__)
+// With ADX/BMI2, MULX keeps the flags untouched and ADCX/ADOX retire the two
+// carry chains of the CIOS multiply in parallel.
+__attribute__((target("adx,bmi2")))
+uint128_t pollardRhoBrent128Adx(const uint128_t &n, const uint128_t &c) { return pollardRhoBrent128Body(n, c); }
+#endif
+
+uint128_t pollardRhoBrent128(const uint128_t &n, const uint128_t &c)
+{
+#if defined(__GNUC__) && defined(__x86_64__)
+    if (__builtin_cpu_supports("adx") && __builtin_cpu_supports("bmi2")) {
+        return pollardRhoBrent128Adx(n, c);
+    }
+#endif
+    return pollardRhoBrent128Body(n, c);
+}
+
 // Pollard's Rho factorization using Brent's improvement.
 // By (Anthropic) Claude
 //
@@ -814,7 +1346,7 @@ BigInteger pollardRhoBrent(const BigInteger& n, const BigInteger& c)
 
 // Driver: try multiple (c) values across available CPU threads.
 // Returns a non-trivial factor, or 1 if all attempts failed.
-BigInteger pollardRho(const BigInteger& n, const BigInteger& sqrtN)
+BigInteger pollardRho(const BigInteger& n, const BigInteger& sqrtN, const size_t& nodeId)
 {
     if (n <= 3U) return 1U;
 
@@ -825,21 +1357,58 @@ BigInteger pollardRho(const BigInteger& n, const BigInteger& sqrtN)
     BigInteger result = 1U;
     std::mutex resultMutex;
 
-    // Each thread tries a different c value.  c = 1 is the classic choice;
-    // we fan out from there.  Values 0 and n-2 are degenerate — skip them.
+    // Each thread tries a different c value, from its own xoshiro256**
+    // stream (seeded per node and attempt, so multinode runs don't repeat
+    // each other's walks).  Values 0 and n-2 are degenerate — skip them.
     const size_t maxAttempts = CpuCount * 8U;
 
     std::vector<std::future<BigInteger>> futures;
     futures.reserve(maxAttempts);
 
+    // Odd moduli of one limb take the divide-free Montgomery loop; two-limb
+    // moduli take the CIOS variant (MULX/ADCX/ADOX where the CPU has them).
+    const bool isOdd = ((n & 1U) != 0U);
+    const bool isOneLimb = isOdd && (n <= (BigInteger)UINT64_MAX);
+    const bool isTwoLimb = isOdd && !isOneLimb && ((n >> 128U) == 0U);
+
     for (size_t attempt = 0U; attempt < maxAttempts; ++attempt) {
-        const BigInteger c = (BigInteger)(attempt + 1U);
-        if (c == n - 2U) continue;
+        Xoshiro256StarStar rng((nodeId << 32U) + attempt);
+
+        if (isOneLimb) {
+            // Four interleaved walks per thread keep the scalar multiplier
+            // pipeline full; degenerate c values are parked by the kernel.
+            std::array<uint64_t, 4U> cs;
+            for (uint64_t &ci : cs) {
+                ci = rng.next() % ((uint64_t)n - 3U) + 1U;
+            }
+            futures.push_back(std::async(std::launch::async,
+                [&n, &found, cs]() -> BigInteger {
+                    if (found.load(std::memory_order_relaxed)) return 1U;
+                    const BigInteger f = pollardRhoBrent64x4((uint64_t)n, cs.data(), found);
+                    if (f > 1U && f < n) {
+                        found.store(true, std::memory_order_relaxed);
+                        return f;
+                    }
+                    return 1U;
+                }));
+            continue;
+        }
+
+        BigInteger c = (BigInteger)(rng.next()) % (n - 3U) + 1U;
+        while (c == n - 2U) {
+            c = (BigInteger)(rng.next()) % (n - 3U) + 1U;
+        }
 
         futures.push_back(std::async(std::launch::async,
-            [&n, &found, c]() -> BigInteger {
+            [&n, &found, c, isTwoLimb]() -> BigInteger {
                 if (found.load(std::memory_order_relaxed)) return 1U;
-                const BigInteger f = pollardRhoBrent(n, c);
+                BigInteger f;
+                if (isTwoLimb) {
+                    const uint128_t f128 = pollardRhoBrent128(toUint128(n), toUint128(c));
+                    f = ((BigInteger)(uint64_t)(f128 >> 64U) << 64U) | (uint64_t)f128;
+                } else {
+                    f = pollardRhoBrent(n, c);
+                }
                 if (f > 1U && f < n) {
                     found.store(true, std::memory_order_relaxed);
                     return f;
@@ -859,8 +1428,8 @@ BigInteger pollardRho(const BigInteger& n, const BigInteger& sqrtN)
     return result;
 }
 
-std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCount, size_t nodeId, size_t gearFactorizationLevel, size_t wheelFactorizationLevel,
-                          double sievingBoundMultiplier, double smoothnessBoundMultiplier, size_t gaussianEliminationRowOffset, bool checkSmallFactors, std::vector<size_t> wheelPrimesExcluded) {
+BigInteger find_a_factor(const BigInteger &toFactor, size_t method, size_t nodeCount, size_t nodeId, size_t gearFactorizationLevel, size_t wheelFactorizationLevel,
+                         double sievingBoundMultiplier, double smoothnessBoundMultiplier, size_t gaussianEliminationRowOffset, bool checkSmallFactors, std::vector<size_t> wheelPrimesExcluded) {
   // Validation section
   if (method > 2U) {
     std::cout << "Mode number " << method << " not implemented. Defaulting to FACTOR_FINDER." << std::endl;
@@ -885,13 +1454,10 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
     std::cout << "Warning: Sieving bound multiplier was set higher than 1.0. A setting of 1.0 indicates to use the full sieving range. (Parameter will be ignored and default to 1.0.)";
   }
 
-  // Convert number to factor from string.
-  const BigInteger toFactor(toFactorStr);
-
   // The largest possible discrete factor of "toFactor" is its square root (as with any integer).
   const BigInteger sqrtN = sqrt(toFactor);
   if (sqrtN * sqrtN == toFactor) {
-    return boost::lexical_cast<std::string>(sqrtN);
+    return sqrtN;
   }
 
   // This level default (scaling) was suggested by Elara (OpenAI GPT).
@@ -903,22 +1469,36 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
     throw std::runtime_error("Your primes are out of size_t range! (Your formula smoothness bound calculates to be " + boost::lexical_cast<std::string>(primeCeilingBigInt) + ".) Consider lowering your smoothness bound, since it's unlikely you want to sieve for primes above 2 to the 64th power, but, if so, you can modify the SieveOfEratosthenes() code slightly to allow for this.");
   }
   // This uses very little memory and time, to find primes.
-  std::vector<size_t> primes = SieveOfEratosthenes(primeCeiling);
+  const std::vector<size_t> &primes = cachedSieveOfEratosthenes(primeCeiling);
   // "it" is the end-of-list iterator for a list up-to-and-including wheelFactorizationLevel.
   const auto itw = std::upper_bound(primes.begin(), primes.end(), wheelFactorizationLevel);
   const auto itg = std::upper_bound(primes.begin(), primes.end(), gearFactorizationLevel);
   const size_t wgDiff = std::distance(itw, itg);
 
   if (checkSmallFactors && !nodeId) {
-    // This is simply trial division up to the ceiling.
+    // This is simply trial division up to the ceiling, but batched in the
+    // style of Bernstein's batch GCD: one gcd of toFactor against the
+    // product of a whole block of primes replaces a big-integer modulo per
+    // prime, and the block is only scanned prime-by-prime when the gcd
+    // proves it holds a divisor.
     std::mutex trialDivisionMutex;
     BigInteger result = 1U;
     for (size_t primeIndex = 0U; (primeIndex < primes.size()) && (result == 1U); primeIndex += 64U) {
       dispatch.dispatch([&toFactor, &primes, &result, &trialDivisionMutex, primeIndex]() -> bool {
         const size_t maxLcv = std::min(primeIndex + 64U, primes.size());
+        BigInteger product = primes[primeIndex];
+        for (size_t pi = primeIndex + 1U; pi < maxLcv; ++pi) {
+          product *= primes[pi];
+        }
+        const BigInteger g = gcd(toFactor, product);
+        if (g == 1U) {
+          return false;
+        }
+        // g is the product of every prime in this block that divides
+        // toFactor; pick out the smallest.
         for (size_t pi = primeIndex; pi < maxLcv; ++pi) {
           const size_t& currentPrime = primes[pi];
-          if (!(toFactor % currentPrime)) {
+          if (!(g % currentPrime)) {
             std::lock_guard<std::mutex> lock(trialDivisionMutex);
             result = currentPrime;
             return true;
@@ -930,20 +1510,20 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
     dispatch.finish();
     // If we've checked all primes below the square root of toFactor, then it's prime.
     if ((result != 1U) || (toFactor <= (primeCeiling * primeCeiling))) {
-      return boost::lexical_cast<std::string>(result);
+      return result;
     }
   }
   // Pollard's Rho: method 2, or as a fast pre-check before Quadratic Sieve.
   // Effective for mid-range semiprimes where trial division is too slow
   // but Quadratic Sieve setup cost isn't yet justified.
   if (isPollardRho || isFactorFinder) {
-    const BigInteger rhoResult = pollardRho(toFactor, sqrtN);
+    const BigInteger rhoResult = pollardRho(toFactor, sqrtN, nodeId);
     if (rhoResult > 1U && rhoResult < toFactor) {
-      return boost::lexical_cast<std::string>(rhoResult);
+      return rhoResult;
     }
     // If Pollard's Rho failed and we're in method 2, report failure.
     if (isPollardRho) {
-      return std::to_string(1);
+      return 1U;
     }
     // Otherwise fall through to Quadratic Sieve.
   }
@@ -982,16 +1562,8 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
 
   // Wheel entry count per largest "gear" scales our brute-force range.
   // This is defined globally:
-  wheel.clear();
-  for (size_t i = 1U; i <= biggestWheel; ++i) {
-    if (!isMultiple(i, gearFactorizationPrimes)) {
-      wheel.push_back(i);
-    }
-  }
-  if (wheel.empty()) {
-    wheel.push_back(1U);
-  }
-  size_t batchItemCount = wheel.size();
+  wheel = &cachedComposeWheel(biggestWheel, gearFactorizationPrimes);
+  size_t batchItemCount = wheel->size();
   const size_t minBatch = 256U;
   if (minBatch > batchItemCount) {
     batchItemCount = ((minBatch + batchItemCount - 1U) / batchItemCount) * batchItemCount;
@@ -1029,8 +1601,8 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
                     rowLimit,
                     isFactorFinder ? 0U : ppStartingBatch,
                     smoothPrimes,
-                    isFactorFinder ? ((wheel.size() > 1U) ? smoothForwardFn : forward(WHEEL1)) : ppForwardFn,
-                    isFactorFinder ? ((wheel.size() > 1U) ? smoothBackwardFn : backward(WHEEL1)) : ppBackwardFn);
+                    isFactorFinder ? ((wheel->size() > 1U) ? smoothForwardFn : forward(WHEEL1)) : ppForwardFn,
+                    isFactorFinder ? ((wheel->size() > 1U) ? smoothBackwardFn : backward(WHEEL1)) : ppBackwardFn);
   // Square of count of smooth primes, for FACTOR_FINDER batch multiplier base unit, was suggested by Lyra (OpenAI GPT)
 
   std::vector<std::future<BigInteger>> futures;
@@ -1059,18 +1631,91 @@ std::string find_a_factor(std::string toFactorStr, size_t method, size_t nodeCou
   for (unsigned cpu = 0U; cpu < futures.size(); ++cpu) {
     const BigInteger r = futures[cpu].get();
     if ((r > 1U) && (r < toFactor)) {
-      return boost::lexical_cast<std::string>(r);
+      return r;
     }
   }
 
   // It's only convenient that a large part of the `FACTOR_FINDER` work
   // happens in a second phase, after a first phase with identical signature.
   if (isFactorFinder) {
-    return boost::lexical_cast<std::string>(worker.solveForFactor());
+    return worker.solveForFactor();
   }
 
   // We would have already returned if we found a factor.
-  return std::to_string(1);
+  return 1U;
+}
+// Marshal a little-endian byte buffer (Python int.to_bytes(..., 'little'))
+// directly into the big integer representation, without a base-10 round trip.
+BigInteger importBigInteger(const py::bytes &b) {
+  const std::string buf(b);
+  BigInteger n = 0U;
+  if (!buf.empty()) {
+    boost::multiprecision::import_bits(n, buf.begin(), buf.end(), 8U, false);
+  }
+  return n;
+}
+
+// The reverse: export as little-endian bytes for Python int.from_bytes(..., 'little').
+py::bytes exportBigInteger(const BigInteger &n) {
+  std::vector<unsigned char> buf;
+  boost::multiprecision::export_bits(n, std::back_inserter(buf), 8U, false);
+  return py::bytes(reinterpret_cast<const char *>(buf.data()), buf.size());
+}
+
+// With the GIL released during a run, nothing else stops two Python threads
+// from entering the factoring core at once — which writes the module-level
+// wheel state and shares the one dispatch queue. Serialize whole runs here:
+// callers keep the GIL released (so other Python threads stay responsive)
+// while they wait their turn, exactly the one-at-a-time semantics the GIL
+// used to provide.
+std::mutex factoringMutex;
+
+py::bytes _find_a_factor(const py::bytes &toFactorBytes, size_t method, size_t nodeCount, size_t nodeId, size_t gearFactorizationLevel, size_t wheelFactorizationLevel,
+                         double sievingBoundMultiplier, double smoothnessBoundMultiplier, size_t gaussianEliminationRowOffset, bool checkSmallFactors,
+                         std::vector<size_t> wheelPrimesExcluded) {
+  const BigInteger toFactor = importBigInteger(toFactorBytes);
+
+  BigInteger result;
+  {
+    // The whole factoring run is pure C++ (and already saturates the worker
+    // threads), so let other Python threads proceed in the meantime.
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(factoringMutex);
+    result = find_a_factor(toFactor, method, nodeCount, nodeId, gearFactorizationLevel, wheelFactorizationLevel, sievingBoundMultiplier, smoothnessBoundMultiplier,
+                           gaussianEliminationRowOffset, checkSmallFactors, wheelPrimesExcluded);
+  }
+
+  return exportBigInteger(result);
+}
+
+std::vector<py::bytes> _find_a_factor_many(const std::vector<py::bytes> &toFactorBytes, size_t method, size_t nodeCount, size_t nodeId, size_t gearFactorizationLevel,
+                                           size_t wheelFactorizationLevel, double sievingBoundMultiplier, double smoothnessBoundMultiplier,
+                                           size_t gaussianEliminationRowOffset, bool checkSmallFactors, std::vector<size_t> wheelPrimesExcluded) {
+  std::vector<BigInteger> toFactor;
+  toFactor.reserve(toFactorBytes.size());
+  for (const py::bytes &b : toFactorBytes) {
+    toFactor.push_back(importBigInteger(b));
+  }
+
+  std::vector<BigInteger> results(toFactor.size());
+  {
+    // One trip across the Python boundary for the whole batch:
+    // each item in turn fans out across all worker threads.
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(factoringMutex);
+    for (size_t i = 0U; i < toFactor.size(); ++i) {
+      results[i] = find_a_factor(toFactor[i], method, nodeCount, nodeId, gearFactorizationLevel, wheelFactorizationLevel, sievingBoundMultiplier,
+                                 smoothnessBoundMultiplier, gaussianEliminationRowOffset, checkSmallFactors, wheelPrimesExcluded);
+    }
+  }
+
+  std::vector<py::bytes> output;
+  output.reserve(results.size());
+  for (const BigInteger &r : results) {
+    output.push_back(exportBigInteger(r));
+  }
+
+  return output;
 }
 } // namespace Qimcifa
 
@@ -1081,5 +1726,6 @@ PYBIND11_MODULE(_find_a_factor, m) {
   // method: 0 = PRIME_PROVER (brute force trial division)
   //         1 = FACTOR_FINDER (Pollard's Rho pre-check + Quadratic Sieve)
   //         2 = POLLARD_RHO (Pollard's Rho only, O(n^1/4))
-  m.def("_find_a_factor", &find_a_factor, "Finds any nontrivial factor of input");
+  m.def("_find_a_factor", &_find_a_factor, "Finds any nontrivial factor of input");
+  m.def("_find_a_factor_many", &_find_a_factor_many, "Finds any nontrivial factor of each input in a batch");
 }
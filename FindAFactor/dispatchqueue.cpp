@@ -1,121 +1,214 @@
-//////////////////////////////////////////////////////////////////////////////////////
-//
-// (C) Daniel Strano and the Qrack contributors 2017-2023. All rights reserved.
-//
-// This is a multithreaded, universal quantum register simulation, allowing
-// (nonphysical) register cloning and direct measurement of probability and
-// phase, to leverage what advantages classical emulation of qubits can have.
-//
-// Licensed under the GNU Lesser General Public License V3.
-// See LICENSE.md in the project root or https://www.gnu.org/licenses/lgpl-3.0.en.html
-// for details.
-
-// From https://github.com/embeddedartistry/embedded-resources/blob/master/examples/cpp/dispatch.cpp
-
-#include "dispatchqueue.hpp"
-
-DispatchQueue::~DispatchQueue()
-{
-    std::unique_lock<std::mutex> lock(lock_);
-
-    if (!isStarted_) {
-        return;
-    }
-
-    std::queue<DispatchFn> empty;
-    std::swap(q_, empty);
-    quit_ = true;
-
-    lock.unlock();
-    cv_.notify_all();
-
-    // Wait for thread to finish before we exit
-    for (size_t i = 0U; i < threads_.size(); ++i) {
-        threads_[i].get();
-    }
-
-    isFinished_ = true;
-    cvFinished_.notify_all();
-}
-
-bool DispatchQueue::finish()
-{
-    std::unique_lock<std::mutex> lock(lock_);
-
-    if (quit_ || !isStarted_) {
-        return false;
-    }
-
-    cvFinished_.wait(lock, [this] { return isFinished_ || quit_; });
-
-    return result;
-}
-
-void DispatchQueue::dump()
-{
-    std::unique_lock<std::mutex> lock(lock_);
-
-    if (quit_ || !isStarted_) {
-        return;
-    }
-
-    std::queue<DispatchFn> empty;
-    std::swap(q_, empty);
-    isFinished_ = true;
-    lock.unlock();
-    cvFinished_.notify_all();
-}
-
-void DispatchQueue::dispatch(const DispatchFn& op)
-{
-    std::unique_lock<std::mutex> lock(lock_);
-
-    if (quit_) {
-        return;
-    }
-
-    q_.push(op);
-    isFinished_ = false;
-    if (!isStarted_) {
-        isStarted_ = true;
-        for (size_t i = 0U; i < threads_.size(); ++i) {
-            threads_[i] = std::async(std::launch::async, [this] { dispatch_thread_handler(); });
-        }
-    }
-
-    // Manual unlocking is done before notifying, to avoid waking up
-    // the waiting thread only to block again (see notify_one for details)
-    lock.unlock();
-    cv_.notify_one();
-}
-
-void DispatchQueue::dispatch_thread_handler(void)
-{
-    std::unique_lock<std::mutex> lock(lock_);
-
-    do {
-        // Wait until we have data or a quit signal
-        cv_.wait(lock, [this] { return (q_.size() || quit_); });
-        // after wait, we own the lock
-
-        if (quit_) {
-            continue;
-        }
-
-        auto op = std::move(q_.front());
-        q_.pop();
-
-        // unlock now that we're done messing with the queue
-        lock.unlock();
-
-        result |= op();
-        quit_ |= result;
-
-        lock.lock();
-
-        if (!q_.size()) {
-            isFinished_ = true;
-            cvFinished_.notify_all();
-        }
-    } while (!quit_);
-}
+//////////////////////////////////////////////////////////////////////////////////////
+//
+// (C) Daniel Strano and the Qrack contributors 2017-2023. All rights reserved.
+//
+// This is a multithreaded, universal quantum register simulation, allowing
+// (nonphysical) register cloning and direct measurement of probability and
+// phase, to leverage what advantages classical emulation of qubits can have.
+//
+// Licensed under the GNU Lesser General Public License V3.
+// See LICENSE.md in the project root or https://www.gnu.org/licenses/lgpl-3.0.en.html
+// for details.
+
+// From https://github.com/embeddedartistry/embedded-resources/blob/master/examples/cpp/dispatch.cpp
+
+#include "dispatchqueue.hpp"
+
+#include <cctype>
+#include <cstdlib>
+#include <string>
+
+#if defined(__linux__)
+#include <pthread.h>
+#include <sched.h>
+#endif
+
+namespace {
+#if defined(__linux__)
+// The same falsy set as the wrapper's _parse_bool, so the whole
+// FINDAFACTOR_* boolean family reads env vars identically:
+// unset, "", "0", "false", and "no" (any case) all mean false.
+bool parseBoolEnv(const char* env)
+{
+    if (!env) {
+        return false;
+    }
+    std::string value(env);
+    for (char& c : value) {
+        c = (char)tolower((unsigned char)c);
+    }
+    return !value.empty() && (value != "0") && (value != "false") && (value != "no");
+}
+#endif
+
+// When FINDAFACTOR_PIN_THREADS is set truthy, pin worker i round-robin
+// over the CPUs this process is allowed to run on. Pinned workers stay
+// on the memory node where they first touched their data, which avoids
+// remote-node DRAM traffic on multi-socket machines.
+void pinWorkerThread(const size_t& i)
+{
+#if defined(__linux__)
+    static const bool pin = parseBoolEnv(std::getenv("FINDAFACTOR_PIN_THREADS"));
+    if (!pin) {
+        return;
+    }
+    cpu_set_t allowed;
+    if (sched_getaffinity(0, sizeof(allowed), &allowed)) {
+        return;
+    }
+    const int count = CPU_COUNT(&allowed);
+    if (!count) {
+        return;
+    }
+    int target = (int)(i % (size_t)count);
+    cpu_set_t one;
+    CPU_ZERO(&one);
+    for (int cpu = 0; cpu < CPU_SETSIZE; ++cpu) {
+        if (!CPU_ISSET(cpu, &allowed)) {
+            continue;
+        }
+        if (!target) {
+            CPU_SET(cpu, &one);
+            break;
+        }
+        --target;
+    }
+    pthread_setaffinity_np(pthread_self(), sizeof(one), &one);
+#else
+    (void)i;
+#endif
+}
+} // namespace
+
+DispatchQueue::~DispatchQueue()
+{
+    std::unique_lock<std::mutex> lock(lock_);
+
+    if (!isStarted_) {
+        return;
+    }
+
+    std::queue<DispatchFn> empty;
+    std::swap(q_, empty);
+    quit_ = true;
+
+    lock.unlock();
+    cv_.notify_all();
+
+    // Wait for thread to finish before we exit
+    for (size_t i = 0U; i < threads_.size(); ++i) {
+        threads_[i].get();
+    }
+
+    isFinished_ = true;
+    cvFinished_.notify_all();
+}
+
+bool DispatchQueue::finish()
+{
+    std::unique_lock<std::mutex> lock(lock_);
+
+    if (!isStarted_) {
+        return false;
+    }
+
+    cvFinished_.wait(lock, [this] { return isFinished_ || quit_; });
+
+    const bool toRet = result;
+
+    if (quit_) {
+        // A task returned true, and the workers have exited their loops.
+        // Drain whatever was still queued and reset, so the queue can be
+        // reused by a later call (e.g. a persistent factoring session)
+        // instead of staying dead for the rest of the process.
+        std::queue<DispatchFn> empty;
+        std::swap(q_, empty);
+        lock.unlock();
+        // quit_ was set by a worker, which doesn't signal cv_; wake any
+        // siblings still asleep in wait() so they can observe quit_ and
+        // exit their loops, or the joins below block forever.
+        cv_.notify_all();
+        for (size_t i = 0U; i < threads_.size(); ++i) {
+            threads_[i].get();
+        }
+        lock.lock();
+        quit_ = false;
+        result = false;
+        isStarted_ = false;
+        isFinished_ = true;
+    }
+
+    return toRet;
+}
+
+void DispatchQueue::dump()
+{
+    std::unique_lock<std::mutex> lock(lock_);
+
+    if (quit_ || !isStarted_) {
+        return;
+    }
+
+    std::queue<DispatchFn> empty;
+    std::swap(q_, empty);
+    isFinished_ = true;
+    lock.unlock();
+    cvFinished_.notify_all();
+}
+
+void DispatchQueue::dispatch(const DispatchFn& op)
+{
+    std::unique_lock<std::mutex> lock(lock_);
+
+    if (quit_) {
+        return;
+    }
+
+    q_.push(op);
+    isFinished_ = false;
+    if (!isStarted_) {
+        isStarted_ = true;
+        for (size_t i = 0U; i < threads_.size(); ++i) {
+            threads_[i] = std::async(std::launch::async, [this, i] {
+                pinWorkerThread(i);
+                dispatch_thread_handler();
+            });
+        }
+    }
+
+    // Manual unlocking is done before notifying, to avoid waking up
+    // the waiting thread only to block again (see notify_one for details)
+    lock.unlock();
+    cv_.notify_one();
+}
+
+void DispatchQueue::dispatch_thread_handler(void)
+{
+    std::unique_lock<std::mutex> lock(lock_);
+
+    do {
+        // Wait until we have data or a quit signal
+        cv_.wait(lock, [this] { return (q_.size() || quit_); });
+        // after wait, we own the lock
+
+        if (quit_) {
+            continue;
+        }
+
+        auto op = std::move(q_.front());
+        q_.pop();
+
+        // unlock now that we're done messing with the queue
+        lock.unlock();
+
+        result |= op();
+        quit_ |= result;
+
+        lock.lock();
+
+        if (!q_.size()) {
+            isFinished_ = true;
+            cvFinished_.notify_all();
+        }
+    } while (!quit_);
+}
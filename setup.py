@@ -23,13 +23,14 @@ class CMakeBuild(build_ext):
         wd = os.getcwd()
         os.makedirs(self.build_temp, exist_ok=True)
         os.chdir(self.build_temp)
-        cmake_args = ['-DCMAKE_LIBRARY_OUTPUT_DIRECTORY=' + extdir]
+        # The per-config output directories make multi-config generators
+        # (MSVC) drop the module straight into extdir, instead of a Release/
+        # subdirectory that would need an ABI-tag-specific rename afterward.
+        cmake_args = ['-DCMAKE_LIBRARY_OUTPUT_DIRECTORY=' + extdir,
+                      '-DCMAKE_LIBRARY_OUTPUT_DIRECTORY_RELEASE=' + extdir,
+                      '-DCMAKE_RUNTIME_OUTPUT_DIRECTORY_RELEASE=' + extdir]
         self.spawn(['cmake', ext.sourcedir] + cmake_args)
-        self.spawn(['cmake', '--build', '.', '--config', 'Release'])
-        if os.name == 'nt':
-            os.chdir(extdir)
-            os.rename('Release/_find_a_factor.cp312-win_amd64.pyd', '_find_a_factor.cp312-win_amd64.pyd')
-            os.rmdir('Release')
+        self.spawn(['cmake', '--build', '.', '--config', 'Release', '--parallel'])
         os.chdir(wd)
 
 README_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'README.md')